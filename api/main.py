@@ -155,7 +155,7 @@ async def create_download(request: DownloadRequest):
     try:
         task = await download_manager.add_download(
             url=request.url,
-            output_path=request.output_path or str(settings.DOWNLOAD_DIR),
+            output_path=request.output_path or settings.download_dir_str,
             format_id=request.format_id,
             quality=request.quality,
             priority=request.priority
@@ -173,7 +173,7 @@ async def get_downloads():
     """Get active downloads"""
     try:
         active = download_manager.get_active_downloads()
-        queue_size = download_manager.queue.qsize()
+        queue_size = download_manager.queue_size()
         return {
             "success": True,
             "active": active,
@@ -187,7 +187,7 @@ async def get_downloads():
 @app.get("/api/downloads/{task_id}", response_model=Dict[str, Any])
 async def get_download_status(task_id: str):
     """Get download status"""
-    status = download_manager.get_download_status(task_id)
+    status = await download_manager.get_download_status(task_id)
     if not status:
         raise HTTPException(status_code=404, detail="Task not found")
     return {"success": True, "task": status}
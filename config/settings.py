@@ -1,10 +1,50 @@
 """Application settings and configuration"""
+import logging
 import os
 from pathlib import Path
 from typing import Optional
+from pydantic import PrivateAttr, field_validator
 from pydantic_settings import BaseSettings
 
 
+# Proxy URL schemes accepted by yt-dlp
+_PROXY_SCHEMES = {"http", "https", "socks4", "socks4a", "socks5", "socks5h"}
+
+# Proxy setting names checked by Settings.unsupported_proxies
+_PROXY_FIELDS = ("HTTP_PROXY", "HTTPS_PROXY", "SOCKS_PROXY")
+
+
+def _proxy_scheme(url: str) -> str:
+    """Get the lower-cased scheme of a proxy URL"""
+    return url.split("://", 1)[0].lower()
+
+
+def _normalize_proxy(url: Optional[str], default_scheme: str) -> Optional[str]:
+    """Normalize a proxy URL once so downstream users get a usable value
+
+    Args:
+        url: Proxy URL, optionally without a scheme
+        default_scheme: Scheme to prepend when missing
+
+    Returns:
+        Normalized proxy URL, or None when unset (unsupported schemes are
+        kept and logged)
+    """
+    if url is None:
+        return None
+    url = url.strip()
+    if not url:
+        return None
+
+    if "://" not in url:
+        url = f"{default_scheme}://{url}"
+
+    if _proxy_scheme(url) not in _PROXY_SCHEMES:
+        # utils.logger imports this module, so use the logger by name
+        logging.getLogger("youtube_downloader").warning(f"Unsupported proxy scheme: {url}")
+    return url
+
+
 class Settings(BaseSettings):
     """Application settings"""
 
@@ -60,6 +100,39 @@ class Settings(BaseSettings):
     HTTPS_PROXY: Optional[str] = None
     SOCKS_PROXY: Optional[str] = None
 
+    @field_validator("HTTP_PROXY", "HTTPS_PROXY")
+    @classmethod
+    def _validate_http_proxy(cls, value: Optional[str]) -> Optional[str]:
+        return _normalize_proxy(value, "http")
+
+    @field_validator("SOCKS_PROXY")
+    @classmethod
+    def _validate_socks_proxy(cls, value: Optional[str]) -> Optional[str]:
+        return _normalize_proxy(value, "socks5")
+
+    def unsupported_proxies(self) -> list:
+        """Get proxy settings whose scheme yt-dlp does not support
+
+        Returns:
+            List of setting names
+        """
+        return [
+            name for name in _PROXY_FIELDS
+            if getattr(self, name) and _proxy_scheme(getattr(self, name)) not in _PROXY_SCHEMES
+        ]
+
+    # Cached (DOWNLOAD_DIR, str(DOWNLOAD_DIR)) pair
+    _download_dir_cache: Optional[tuple] = PrivateAttr(default=None)
+
+    @property
+    def download_dir_str(self) -> str:
+        """DOWNLOAD_DIR as a string, recomputed only when DOWNLOAD_DIR is reassigned"""
+        cache = self._download_dir_cache
+        if cache is None or cache[0] is not self.DOWNLOAD_DIR:
+            cache = (self.DOWNLOAD_DIR, str(self.DOWNLOAD_DIR))
+            self._download_dir_cache = cache
+        return cache[1]
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
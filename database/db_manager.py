@@ -1,7 +1,7 @@
 """Database manager for YouTube Downloader"""
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine, and_, or_, desc, func
+from sqlalchemy import create_engine, event, and_, or_, desc, func
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
@@ -14,6 +14,10 @@ from config.settings import settings
 from utils.logger import logger
 
 
+# Maximum bound parameters per IN (...) query (SQLite's default limit is 999)
+_IN_CHUNK_SIZE = 900
+
+
 class DatabaseManager:
     """Database manager class"""
 
@@ -29,6 +33,8 @@ class DatabaseManager:
             echo=settings.DEBUG,
             pool_pre_ping=True
         )
+        if self.engine.dialect.name == 'sqlite':
+            event.listen(self.engine, 'connect', self._configure_sqlite_connection)
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
@@ -36,6 +42,26 @@ class DatabaseManager:
         )
         self._create_tables()
 
+        # key -> value cache filled by get_all_settings, dropped on writes
+        self._settings_cache: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def _configure_sqlite_connection(dbapi_connection, connection_record):
+        """Apply SQLite PRAGMAs to each new connection
+
+        WAL journaling with synchronous=NORMAL avoids an fsync per commit,
+        which keeps small writes (e.g. settings) from stalling the caller.
+
+        Args:
+            dbapi_connection: Raw DB-API connection
+            connection_record: Pool connection record
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
     def _create_tables(self):
         """Create all database tables"""
         Base.metadata.create_all(bind=self.engine)
@@ -110,6 +136,35 @@ class DatabaseManager:
             exists = session.query(DownloadHistory).filter_by(url=url).first() is not None
             return exists
 
+    def check_duplicates_bulk(self, urls: List[str]) -> set:
+        """Check many URLs against the download history at once
+
+        Args:
+            urls: Video URLs
+
+        Returns:
+            Set of the given URLs that were already downloaded
+        """
+        urls = list(dict.fromkeys(urls))
+        found = set()
+        with self.get_session() as session:
+            for i in range(0, len(urls), _IN_CHUNK_SIZE):
+                chunk = urls[i:i + _IN_CHUNK_SIZE]
+                found.update(
+                    url for (url,) in
+                    session.query(DownloadHistory.url).filter(DownloadHistory.url.in_(chunk))
+                )
+        return found
+
+    def get_downloaded_urls(self) -> set:
+        """Get every URL in the download history
+
+        Returns:
+            Set of downloaded URLs
+        """
+        with self.get_session() as session:
+            return {url for (url,) in session.query(DownloadHistory.url)}
+
     def get_download_history(
         self,
         skip: int = 0,
@@ -389,6 +444,33 @@ class DatabaseManager:
             session.flush()
             return queue_item
 
+    def add_to_queue_bulk(self, queue_infos: List[Dict[str, Any]]) -> int:
+        """Add several items to the download queue in one transaction
+
+        Args:
+            queue_infos: Queue item information, as for add_to_queue
+
+        Returns:
+            Number of items added
+        """
+        if not queue_infos:
+            return 0
+
+        with self.get_session() as session:
+            session.bulk_insert_mappings(DownloadQueue, [
+                {
+                    'id': info['id'],
+                    'url': info['url'],
+                    'priority': info.get('priority', 5),
+                    'output_path': info.get('output_path'),
+                    'format_id': info.get('format_id'),
+                    'quality': info.get('quality'),
+                }
+                for info in queue_infos
+            ])
+
+        return len(queue_infos)
+
     def get_queue_items(
         self,
         status: Optional[str] = None,
@@ -416,6 +498,41 @@ class DatabaseManager:
 
             return query.all()
 
+    def get_queue_item(self, queue_id: str) -> Optional[Dict[str, Any]]:
+        """Get one queue item as a dictionary
+
+        Args:
+            queue_id: Queue item ID
+
+        Returns:
+            Queue item dictionary or None
+        """
+        with self.get_session() as session:
+            item = session.get(DownloadQueue, queue_id)
+            if not item:
+                return None
+
+            return {
+                'id': item.id,
+                'url': item.url,
+                'status': item.status,
+                'priority': item.priority,
+                'progress': item.progress,
+                'speed': item.speed,
+                'eta': item.eta,
+                'downloaded_bytes': item.downloaded_bytes,
+                'total_bytes': item.total_bytes,
+                'error_message': item.error_message,
+                'retry_count': item.retry_count,
+                'output_path': item.output_path,
+                'format_id': item.format_id,
+                'quality': item.quality,
+                'metadata': item.get_metadata(),
+                'created_at': item.created_at.isoformat() if item.created_at else None,
+                'started_at': item.started_at.isoformat() if item.started_at else None,
+                'completed_at': item.completed_at.isoformat() if item.completed_at else None,
+            }
+
     def update_queue_status(
         self,
         queue_id: str,
@@ -436,20 +553,61 @@ class DatabaseManager:
             item = session.query(DownloadQueue).filter_by(id=queue_id).first()
 
             if item:
-                item.status = status
+                self._apply_queue_status(item, status, kwargs)
+                session.flush()
 
-                for key, value in kwargs.items():
-                    if hasattr(item, key):
-                        setattr(item, key, value)
+            return item
 
-                if status == 'downloading' and not item.started_at:
-                    item.started_at = datetime.now()
-                elif status in ('completed', 'failed', 'cancelled'):
-                    item.completed_at = datetime.now()
+    def bulk_update_queue_status(
+        self,
+        updates: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> int:
+        """Apply several queue status updates in one transaction
 
-                session.flush()
+        Args:
+            updates: List of (queue_id, status, fields) in the order they happened
 
-            return item
+        Returns:
+            Number of updates applied
+        """
+        if not updates:
+            return 0
+
+        with self.get_session() as session:
+            ids = {queue_id for queue_id, _, _ in updates}
+            items = {
+                item.id: item
+                for item in session.query(DownloadQueue).filter(DownloadQueue.id.in_(ids))
+            }
+
+            applied = 0
+            for queue_id, status, fields in updates:
+                item = items.get(queue_id)
+                if item:
+                    self._apply_queue_status(item, status, fields)
+                    applied += 1
+
+            return applied
+
+    @staticmethod
+    def _apply_queue_status(item: DownloadQueue, status: str, fields: Dict[str, Any]) -> None:
+        """Set status and extra fields on a queue item
+
+        Args:
+            item: Queue item
+            status: New status
+            fields: Additional fields to update
+        """
+        item.status = status
+
+        for key, value in fields.items():
+            if hasattr(item, key):
+                setattr(item, key, value)
+
+        if status == 'downloading' and not item.started_at:
+            item.started_at = datetime.now()
+        elif status in ('completed', 'failed', 'cancelled'):
+            item.completed_at = datetime.now()
 
     # ===== Settings =====
 
@@ -469,6 +627,20 @@ class DatabaseManager:
                 return setting.get_value()
             return default
 
+    def get_all_settings(self) -> Dict[str, Any]:
+        """Get all setting values with a single query
+
+        Returns:
+            Dictionary of setting key to value
+        """
+        if self._settings_cache is None:
+            with self.get_session() as session:
+                self._settings_cache = {
+                    setting.key: setting.get_value()
+                    for setting in session.query(Settings).all()
+                }
+        return dict(self._settings_cache)
+
     def set_setting(self, key: str, value: Any, description: str = "") -> Settings:
         """Set setting value
 
@@ -492,4 +664,45 @@ class DatabaseManager:
                 session.add(setting)
 
             session.flush()
-            return setting
+
+        # Drop the cache once the write is committed
+        self._settings_cache = None
+        return setting
+
+    def set_settings_bulk(self, values: Dict[str, Any]) -> int:
+        """Set several setting values in one transaction
+
+        Args:
+            values: Dictionary of setting key to value
+
+        Returns:
+            Number of settings written
+        """
+        # Skip values that already match the cache
+        cache = self._settings_cache
+        if cache is not None:
+            values = {
+                key: value for key, value in values.items()
+                if key not in cache or cache[key] != value
+            }
+        if not values:
+            return 0
+
+        with self.get_session() as session:
+            existing = {
+                setting.key: setting
+                for setting in session.query(Settings).filter(Settings.key.in_(values))
+            }
+            now = datetime.now()
+            for key, value in values.items():
+                setting = existing.get(key)
+                if setting:
+                    setting.set_value(value)
+                    setting.updated_at = now
+                else:
+                    setting = Settings(key=key, description="")
+                    setting.set_value(value)
+                    session.add(setting)
+
+        self._settings_cache = None
+        return len(values)
@@ -11,12 +11,31 @@ import asyncio
 from utils.logger import logger
 
 
+# Quality combo label -> yt-dlp format selector (None uses the default)
+_QUALITY_FORMATS = {
+    "最高品質": None,  # Will use default: bestvideo+bestaudio/best
+    "1080p": "bestvideo[height<=1080]+bestaudio/bestvideo[height<=1080]/best[height<=1080]",
+    "720p": "bestvideo[height<=720]+bestaudio/bestvideo[height<=720]/best[height<=720]",
+    "480p": "bestvideo[height<=480]+bestaudio/bestvideo[height<=480]/best[height<=480]",
+    "360p": "bestvideo[height<=360]+bestaudio/bestvideo[height<=360]/best[height<=360]",
+    "音声のみ": "bestaudio/best"
+}
+
+
 class DownloadTab(QWidget):
     """Download tab widget"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, loop_provider=None):
+        """Initialize tab
+
+        Args:
+            parent: Parent widget
+            loop_provider: Callable returning the service event loop or None
+        """
         super().__init__(parent)
 
+        self._get_loop = loop_provider or (lambda: None)
+
         self.download_manager = None
         self.db_manager = None
         self.timer = QTimer()
@@ -54,7 +73,7 @@ class DownloadTab(QWidget):
 
         # Quality selection
         self.quality_combo = QComboBox()
-        self.quality_combo.addItems(["最高品質", "1080p", "720p", "480p", "360p", "音声のみ"])
+        self.quality_combo.addItems(list(_QUALITY_FORMATS))
         options_layout.addWidget(QLabel("品質:"))
         options_layout.addWidget(self.quality_combo)
 
@@ -108,24 +127,14 @@ class DownloadTab(QWidget):
             QMessageBox.warning(self, "エラー", "ダウンロードマネージャーが初期化されていません")
             return
 
-        quality_map = {
-            "最高品質": None,  # Will use default: bestvideo+bestaudio/best
-            "1080p": "bestvideo[height<=1080]+bestaudio/bestvideo[height<=1080]/best[height<=1080]",
-            "720p": "bestvideo[height<=720]+bestaudio/bestvideo[height<=720]/best[height<=720]",
-            "480p": "bestvideo[height<=480]+bestaudio/bestvideo[height<=480]/best[height<=480]",
-            "360p": "bestvideo[height<=360]+bestaudio/bestvideo[height<=360]/best[height<=360]",
-            "音声のみ": "bestaudio/best"
-        }
-
         quality = self.quality_combo.currentText()
-        format_id = quality_map.get(quality)
+        format_id = _QUALITY_FORMATS.get(quality)
         priority = self.priority_spin.value()
 
         try:
-            # Get the event loop from the parent window's service thread
-            from gui.main_window import MainWindow
-            parent = self.window()
-            if isinstance(parent, MainWindow) and parent.service_thread and parent.service_thread.loop:
+            # Get the event loop of the service thread
+            loop = self._get_loop()
+            if loop:
                 # Add download (async) in the correct event loop
                 future = asyncio.run_coroutine_threadsafe(
                     self.download_manager.add_download(
@@ -133,7 +142,7 @@ class DownloadTab(QWidget):
                         format_id=format_id,
                         priority=priority
                     ),
-                    parent.service_thread.loop
+                    loop
                 )
 
                 # Wait for result (with timeout)
@@ -166,14 +175,13 @@ class DownloadTab(QWidget):
             return
 
         try:
-            # Get the event loop from the parent window's service thread
-            from gui.main_window import MainWindow
-            parent = self.window()
-            if isinstance(parent, MainWindow) and parent.service_thread and parent.service_thread.loop:
+            # Get the event loop of the service thread
+            loop = self._get_loop()
+            if loop:
                 # Get info (async) in the correct event loop
                 future = asyncio.run_coroutine_threadsafe(
                     self.download_manager.get_video_info(url),
-                    parent.service_thread.loop
+                    loop
                 )
                 info = future.result(timeout=30)
 
@@ -261,12 +269,11 @@ class DownloadTab(QWidget):
             return
 
         try:
-            from gui.main_window import MainWindow
-            parent = self.window()
-            if isinstance(parent, MainWindow) and parent.service_thread and parent.service_thread.loop:
+            loop = self._get_loop()
+            if loop:
                 future = asyncio.run_coroutine_threadsafe(
                     self.download_manager.pause_download(task_id),
-                    parent.service_thread.loop
+                    loop
                 )
                 future.result(timeout=2)
                 logger.info(f"Paused download: {task_id}")
@@ -287,12 +294,11 @@ class DownloadTab(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                from gui.main_window import MainWindow
-                parent = self.window()
-                if isinstance(parent, MainWindow) and parent.service_thread and parent.service_thread.loop:
+                loop = self._get_loop()
+                if loop:
                     future = asyncio.run_coroutine_threadsafe(
                         self.download_manager.cancel_download(task_id),
-                        parent.service_thread.loop
+                        loop
                     )
                     future.result(timeout=2)
                     logger.info(f"Cancelled download: {task_id}")
@@ -19,12 +19,22 @@ class HistoryTab(QWidget):
         self.current_page = 0
         self.page_size = 50
 
+        # History is queried on first show; see showEvent
+        self._history_loaded = False
+
         self._init_ui()
 
     def set_managers(self, db_manager):
         """Set managers"""
         self.db_manager = db_manager
-        self._load_history()
+        if self.isVisible():
+            self._load_history()
+
+    def showEvent(self, event):
+        """Load history the first time the tab is shown"""
+        if not self._history_loaded and self.db_manager:
+            self._load_history()
+        super().showEvent(event)
 
     def _init_ui(self):
         """Initialize UI"""
@@ -101,26 +111,7 @@ class HistoryTab(QWidget):
                 limit=self.page_size
             )
 
-            self.history_table.setRowCount(len(history))
-
-            for row, item in enumerate(history):
-                # Title
-                self.history_table.setItem(row, 0, QTableWidgetItem(item.title or 'N/A'))
-
-                # Channel
-                self.history_table.setItem(row, 1, QTableWidgetItem(item.channel_name or 'N/A'))
-
-                # Date
-                date_str = item.download_date.strftime('%Y-%m-%d %H:%M:%S') if item.download_date else 'N/A'
-                self.history_table.setItem(row, 2, QTableWidgetItem(date_str))
-
-                # File path
-                self.history_table.setItem(row, 3, QTableWidgetItem(item.file_path or 'N/A'))
-
-                # Size
-                size = item.file_size or 0
-                size_str = f"{size / 1024 / 1024:.2f} MB" if size else 'N/A'
-                self.history_table.setItem(row, 4, QTableWidgetItem(size_str))
+            self._populate_table(history)
 
             # Update page label
             self.page_label.setText(f"Page {self.current_page + 1}")
@@ -131,6 +122,7 @@ class HistoryTab(QWidget):
 
             # Load stats
             self._load_stats()
+            self._history_loaded = True
 
         except Exception as e:
             logger.error(f"Error loading history: {e}")
@@ -149,23 +141,42 @@ class HistoryTab(QWidget):
                 search_query=search_query if search_query else None
             )
 
-            self.history_table.setRowCount(len(history))
+            self._populate_table(history)
+
+        except Exception as e:
+            logger.error(f"Error searching history: {e}")
+
+    def _populate_table(self, history):
+        """Fill the history table with history records
+
+        Args:
+            history: List of DownloadHistory records
+        """
+        table = self.history_table
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(history))
 
             for row, item in enumerate(history):
-                self.history_table.setItem(row, 0, QTableWidgetItem(item.title or 'N/A'))
-                self.history_table.setItem(row, 1, QTableWidgetItem(item.channel_name or 'N/A'))
+                # Title
+                table.setItem(row, 0, QTableWidgetItem(item.title or 'N/A'))
 
+                # Channel
+                table.setItem(row, 1, QTableWidgetItem(item.channel_name or 'N/A'))
+
+                # Date
                 date_str = item.download_date.strftime('%Y-%m-%d %H:%M:%S') if item.download_date else 'N/A'
-                self.history_table.setItem(row, 2, QTableWidgetItem(date_str))
+                table.setItem(row, 2, QTableWidgetItem(date_str))
 
-                self.history_table.setItem(row, 3, QTableWidgetItem(item.file_path or 'N/A'))
+                # File path
+                table.setItem(row, 3, QTableWidgetItem(item.file_path or 'N/A'))
 
+                # Size
                 size = item.file_size or 0
                 size_str = f"{size / 1024 / 1024:.2f} MB" if size else 'N/A'
-                self.history_table.setItem(row, 4, QTableWidgetItem(size_str))
-
-        except Exception as e:
-            logger.error(f"Error searching history: {e}")
+                table.setItem(row, 4, QTableWidgetItem(size_str))
+        finally:
+            table.setUpdatesEnabled(True)
 
     def _load_stats(self):
         """Load statistics"""
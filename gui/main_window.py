@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
     QMainWindow, QTabWidget, QWidget, QVBoxLayout,
     QSystemTrayIcon, QMenu, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Qt, Signal, QThread, QSettings
 from PySide6.QtGui import QIcon, QAction
 import asyncio
 import sys
@@ -45,6 +45,9 @@ class ServiceThread(QThread):
 class MainWindow(QMainWindow):
     """Main application window"""
 
+    # Seconds closeEvent waits for the services to stop
+    SHUTDOWN_TIMEOUT = 10.0
+
     def __init__(self):
         super().__init__()
 
@@ -90,10 +93,10 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.tabs)
 
         # Create tabs (managers will be set later)
-        self.download_tab = DownloadTab()
-        self.schedule_tab = ScheduleTab()
+        self.download_tab = DownloadTab(loop_provider=self.get_service_loop)
+        self.schedule_tab = ScheduleTab(loop_provider=self.get_service_loop)
         self.history_tab = HistoryTab()
-        self.settings_tab = SettingsTab()
+        self.settings_tab = SettingsTab(loop_provider=self.get_service_loop)
 
         # Add tabs
         self.tabs.addTab(self.download_tab, "ダウンロード")
@@ -104,8 +107,39 @@ class MainWindow(QMainWindow):
         # Menu bar
         self._create_menu_bar()
 
+        # Restore window geometry and last tab
+        self._restore_view_state()
+
         logger.info("UI initialized")
 
+    def get_service_loop(self):
+        """Get the service thread's event loop
+
+        Returns:
+            Event loop, or None if the service thread is not running yet
+        """
+        if self.service_thread:
+            return self.service_thread.loop
+        return None
+
+    def _restore_view_state(self):
+        """Restore GUI view state kept outside the database"""
+        view_state = QSettings("ytgui", "gui")
+
+        geometry = view_state.value("geometry")
+        if geometry:
+            self.restoreGeometry(geometry)
+
+        last_tab = view_state.value("last_tab", 0, type=int)
+        if 0 <= last_tab < self.tabs.count():
+            self.tabs.setCurrentIndex(last_tab)
+
+    def _save_view_state(self):
+        """Save GUI view state kept outside the database"""
+        view_state = QSettings("ytgui", "gui")
+        view_state.setValue("geometry", self.saveGeometry())
+        view_state.setValue("last_tab", self.tabs.currentIndex())
+
     def _create_menu_bar(self):
         """Create menu bar"""
         menubar = self.menuBar()
@@ -255,12 +289,20 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close event"""
+        self._save_view_state()
+
         # Stop services
         if self.service_thread:
-            asyncio.run_coroutine_threadsafe(
-                service_manager.stop_all(),
-                self.service_thread.loop
-            )
+            if self.service_thread.loop:
+                future = asyncio.run_coroutine_threadsafe(
+                    service_manager.stop_all(),
+                    self.service_thread.loop
+                )
+                # Let services flush and shut down before the loop stops
+                try:
+                    future.result(timeout=self.SHUTDOWN_TIMEOUT)
+                except Exception as e:
+                    logger.error(f"Failed to stop services: {e}")
             self.service_thread.stop()
             self.service_thread.wait()
 
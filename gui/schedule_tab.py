@@ -10,6 +10,19 @@ from PySide6.QtCore import Qt, QTimer
 from utils.logger import logger
 
 
+# Task type combo label -> task_type
+_TASK_TYPES = {
+    "チャンネル更新チェック": "channel_download",
+    "プレイリストダウンロード": "playlist_download"
+}
+
+# task_type -> table label
+_TASK_TYPE_LABELS = {
+    'channel_download': 'チャンネル',
+    'playlist_download': 'プレイリスト'
+}
+
+
 class AddScheduleDialog(QDialog):
     """Dialog for adding scheduled task"""
 
@@ -28,10 +41,7 @@ class AddScheduleDialog(QDialog):
 
         # Task type
         self.task_type_combo = QComboBox()
-        self.task_type_combo.addItems([
-            "チャンネル更新チェック",
-            "プレイリストダウンロード"
-        ])
+        self.task_type_combo.addItems(list(_TASK_TYPES))
         layout.addRow("タスク種類:", self.task_type_combo)
 
         # URL
@@ -55,14 +65,9 @@ class AddScheduleDialog(QDialog):
 
     def get_data(self):
         """Get form data"""
-        task_type_map = {
-            "チャンネル更新チェック": "channel_download",
-            "プレイリストダウンロード": "playlist_download"
-        }
-
         return {
             'name': self.name_input.text(),
-            'task_type': task_type_map[self.task_type_combo.currentText()],
+            'task_type': _TASK_TYPES[self.task_type_combo.currentText()],
             'cron_expression': self.schedule_input.text(),
             'parameters': {
                 'channel_url' if 'チャンネル' in self.task_type_combo.currentText() else 'playlist_url': self.url_input.text()
@@ -73,9 +78,17 @@ class AddScheduleDialog(QDialog):
 class ScheduleTab(QWidget):
     """Schedule tab widget"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, loop_provider=None):
+        """Initialize tab
+
+        Args:
+            parent: Parent widget
+            loop_provider: Callable returning the service event loop or None
+        """
         super().__init__(parent)
 
+        self._get_loop = loop_provider or (lambda: None)
+
         self.schedule_manager = None
         self.db_manager = None
         self.timer = QTimer()
@@ -133,9 +146,8 @@ class ScheduleTab(QWidget):
 
             try:
                 import asyncio
-                from gui.main_window import MainWindow
-                parent = self.window()
-                if isinstance(parent, MainWindow) and parent.service_thread and parent.service_thread.loop:
+                loop = self._get_loop()
+                if loop:
                     future = asyncio.run_coroutine_threadsafe(
                         self.schedule_manager.add_scheduled_task(
                             name=data['name'],
@@ -143,7 +155,7 @@ class ScheduleTab(QWidget):
                             task_type=data['task_type'],
                             parameters=data['parameters']
                         ),
-                        parent.service_thread.loop
+                        loop
                     )
                     future.result(timeout=5)
 
@@ -166,17 +178,12 @@ class ScheduleTab(QWidget):
 
             self.schedules_table.setRowCount(len(tasks))
 
-            task_type_map = {
-                'channel_download': 'チャンネル',
-                'playlist_download': 'プレイリスト'
-            }
-
             for row, task in enumerate(tasks):
                 # Name
                 self.schedules_table.setItem(row, 0, QTableWidgetItem(task.get('name', '')))
 
                 # Type
-                task_type = task_type_map.get(task.get('task_type', ''), 'Unknown')
+                task_type = _TASK_TYPE_LABELS.get(task.get('task_type', ''), 'Unknown')
                 self.schedules_table.setItem(row, 1, QTableWidgetItem(task_type))
 
                 # Cron expression
@@ -223,12 +230,11 @@ class ScheduleTab(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 import asyncio
-                from gui.main_window import MainWindow
-                parent = self.window()
-                if isinstance(parent, MainWindow) and parent.service_thread and parent.service_thread.loop:
+                loop = self._get_loop()
+                if loop:
                     future = asyncio.run_coroutine_threadsafe(
                         self.schedule_manager.remove_task(task_id),
-                        parent.service_thread.loop
+                        loop
                     )
                     future.result(timeout=5)
 
@@ -1,26 +1,87 @@
 """Settings tab for YouTube Downloader GUI"""
+import asyncio
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit,
     QPushButton, QLabel, QGroupBox, QCheckBox,
     QSpinBox, QFileDialog, QComboBox, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, QSignalBlocker, QThreadPool, Signal
 
 from config.settings import settings
 from utils.logger import logger
 
 
+# Settings shown in this tab (DOWNLOAD_DIR is snapshotted as a string)
+_SNAPSHOT_KEYS = ('MAX_CONCURRENT_DOWNLOADS', 'ENABLE_GPU', 'GPU_ENCODER')
+
+# GPU encoder choices: (label, settings.GPU_ENCODER key)
+_GPU_ENCODERS = (
+    ("自動", "auto"),
+    ("NVENC (NVIDIA)", "nvenc"),
+    ("QuickSync (Intel)", "qsv"),
+    ("AMF (AMD)", "amf"),
+)
+
+
+class _SaveSettingsSignals(QObject):
+    """Signals emitted by _SaveSettingsTask"""
+    # (success, error, staged settings values)
+    finished = Signal(bool, str, object)
+
+
+class _SaveSettingsTask(QRunnable):
+    """Persist settings to the database off the GUI thread"""
+
+    def __init__(self, db_manager, values, staged):
+        super().__init__()
+        self.db_manager = db_manager
+        self.values = values
+        self.staged = staged
+        self.signals = _SaveSettingsSignals()
+
+    def run(self):
+        """Write settings and report the result"""
+        try:
+            self.db_manager.set_settings_bulk(self.values)
+            self.signals.finished.emit(True, "", self.staged)
+        except Exception as e:
+            logger.error(f"Failed to save settings: {e}")
+            self.signals.finished.emit(False, str(e), self.staged)
+
+
 class SettingsTab(QWidget):
     """Settings tab widget"""
 
-    def __init__(self, parent=None):
+    # Emitted from the service loop thread when authentication finishes
+    login_finished = Signal(bool, str)
+
+    # Seconds before a login attempt is given up on; a little longer than
+    # AuthManager.AUTH_TIMEOUT so the manager normally reports first
+    LOGIN_TIMEOUT = 330
+
+    def __init__(self, parent=None, loop_provider=None):
+        """Initialize tab
+
+        Args:
+            parent: Parent widget
+            loop_provider: Callable returning the service event loop or None
+        """
         super().__init__(parent)
 
+        self._get_loop = loop_provider or (lambda: None)
+
         self.auth_manager = None
         self.encode_manager = None
         self.db_manager = None
 
-        self._init_ui()
+        # Widgets are built on first show; see showEvent
+        self._ui_built = False
+        self._cfg = {}
+        # Settings keys edited by the user since the last save
+        self._dirty = set()
+
+        self.login_finished.connect(self._on_login_finished)
 
     def set_managers(self, auth_manager, encode_manager, db_manager):
         """Set managers"""
@@ -29,57 +90,69 @@ class SettingsTab(QWidget):
         self.db_manager = db_manager
         self._load_settings()
 
+    def showEvent(self, event):
+        """Build the UI the first time the tab is shown"""
+        if not self._ui_built:
+            # Build the whole widget tree with a single relayout/repaint
+            self.setUpdatesEnabled(False)
+            try:
+                self._init_ui()
+                self.layout().activate()
+            finally:
+                self.setUpdatesEnabled(True)
+            self._ui_built = True
+            self._load_settings()
+        super().showEvent(event)
+
+    def _snapshot_settings(self):
+        """Snapshot the settings values used by this tab"""
+        self._cfg = {key: getattr(settings, key) for key in _SNAPSHOT_KEYS}
+        self._cfg['DOWNLOAD_DIR'] = settings.download_dir_str
+
     def _init_ui(self):
         """Initialize UI"""
+        self._snapshot_settings()
+        cfg = self._cfg
+
         layout = QVBoxLayout()
         self.setLayout(layout)
 
         # Download settings
         download_group = QGroupBox("ダウンロード設定")
-        download_layout = QVBoxLayout()
+        download_layout = QFormLayout()
         download_group.setLayout(download_layout)
 
         # Download directory
-        dir_layout = QHBoxLayout()
-        dir_layout.addWidget(QLabel("保存先:"))
         self.download_dir_input = QLineEdit()
-        self.download_dir_input.setText(str(settings.DOWNLOAD_DIR))
-        dir_layout.addWidget(self.download_dir_input)
-
+        self.download_dir_input.setText(cfg['DOWNLOAD_DIR'])
         browse_button = QPushButton("参照")
         browse_button.clicked.connect(self._browse_directory)
-        dir_layout.addWidget(browse_button)
-        download_layout.addLayout(dir_layout)
+        download_layout.addRow(
+            "保存先:", self._widget_row(self.download_dir_input, browse_button, stretch=False)
+        )
 
         # Max concurrent downloads
-        concurrent_layout = QHBoxLayout()
-        concurrent_layout.addWidget(QLabel("同時ダウンロード数:"))
         self.concurrent_spin = QSpinBox()
-        self.concurrent_spin.setMinimum(1)
-        self.concurrent_spin.setMaximum(10)
-        self.concurrent_spin.setValue(settings.MAX_CONCURRENT_DOWNLOADS)
-        concurrent_layout.addWidget(self.concurrent_spin)
-        concurrent_layout.addStretch()
-        download_layout.addLayout(concurrent_layout)
+        self.concurrent_spin.setRange(1, 10)
+        self.concurrent_spin.setValue(cfg['MAX_CONCURRENT_DOWNLOADS'])
+        download_layout.addRow("同時ダウンロード数:", self.concurrent_spin)
 
         layout.addWidget(download_group)
 
         # GPU settings
         gpu_group = QGroupBox("GPU設定")
-        gpu_layout = QVBoxLayout()
+        gpu_layout = QFormLayout()
         gpu_group.setLayout(gpu_layout)
 
         self.gpu_checkbox = QCheckBox("GPU アクセラレーションを有効にする")
-        self.gpu_checkbox.setChecked(settings.ENABLE_GPU)
-        gpu_layout.addWidget(self.gpu_checkbox)
+        self.gpu_checkbox.setChecked(cfg['ENABLE_GPU'])
+        gpu_layout.addRow(self.gpu_checkbox)
 
-        gpu_encoder_layout = QHBoxLayout()
-        gpu_encoder_layout.addWidget(QLabel("GPU エンコーダー:"))
         self.gpu_encoder_combo = QComboBox()
-        self.gpu_encoder_combo.addItems(["自動", "NVENC (NVIDIA)", "QuickSync (Intel)", "AMF (AMD)"])
-        gpu_encoder_layout.addWidget(self.gpu_encoder_combo)
-        gpu_encoder_layout.addStretch()
-        gpu_layout.addLayout(gpu_encoder_layout)
+        for label, key in _GPU_ENCODERS:
+            self.gpu_encoder_combo.addItem(label, key)
+        self._select_gpu_encoder(cfg['GPU_ENCODER'])
+        gpu_layout.addRow("GPU エンコーダー:", self.gpu_encoder_combo)
 
         layout.addWidget(gpu_group)
 
@@ -91,34 +164,60 @@ class SettingsTab(QWidget):
         self.auth_status_label = QLabel("認証状態: 未認証")
         auth_layout.addWidget(self.auth_status_label)
 
-        auth_button_layout = QHBoxLayout()
         self.login_button = QPushButton("Google ログイン")
         self.login_button.clicked.connect(self._login)
         self.logout_button = QPushButton("ログアウト")
         self.logout_button.clicked.connect(self._logout)
-        auth_button_layout.addWidget(self.login_button)
-        auth_button_layout.addWidget(self.logout_button)
-        auth_button_layout.addStretch()
-        auth_layout.addLayout(auth_button_layout)
+        auth_layout.addLayout(self._widget_row(self.login_button, self.logout_button))
 
         layout.addWidget(auth_group)
 
         # Save button
-        save_layout = QHBoxLayout()
-        save_button = QPushButton("設定を保存")
-        save_button.clicked.connect(self._save_settings)
-        save_layout.addWidget(save_button)
-        save_layout.addStretch()
-        layout.addLayout(save_layout)
+        self.save_button = QPushButton("設定を保存")
+        self.save_button.clicked.connect(self._save_settings)
+        layout.addLayout(self._widget_row(self.save_button))
 
         layout.addStretch()
 
+        # (settings key, database key, widget, value getter) for each saved field
+        self._field_map = (
+            ('DOWNLOAD_DIR', 'download_dir', self.download_dir_input, QLineEdit.text),
+            ('MAX_CONCURRENT_DOWNLOADS', 'max_concurrent_downloads', self.concurrent_spin, QSpinBox.value),
+            ('ENABLE_GPU', 'enable_gpu', self.gpu_checkbox, QCheckBox.isChecked),
+            ('GPU_ENCODER', 'gpu_encoder', self.gpu_encoder_combo, QComboBox.currentData),
+        )
+
+        # Track edits so saving only looks at touched fields
+        for key, signal in (
+            ('DOWNLOAD_DIR', self.download_dir_input.textChanged),
+            ('MAX_CONCURRENT_DOWNLOADS', self.concurrent_spin.valueChanged),
+            ('ENABLE_GPU', self.gpu_checkbox.toggled),
+            ('GPU_ENCODER', self.gpu_encoder_combo.currentIndexChanged),
+        ):
+            signal.connect(lambda *_, key=key: self._dirty.add(key))
+
+    @staticmethod
+    def _widget_row(*widgets, stretch=True) -> QHBoxLayout:
+        """Build a horizontal row of widgets"""
+        row = QHBoxLayout()
+        for widget in widgets:
+            row.addWidget(widget)
+        if stretch:
+            row.addStretch()
+        return row
+
+    def _select_gpu_encoder(self, key):
+        """Select GPU encoder combo item by settings key"""
+        index = self.gpu_encoder_combo.findData(key or "auto")
+        if index >= 0 and index != self.gpu_encoder_combo.currentIndex():
+            self.gpu_encoder_combo.setCurrentIndex(index)
+
     def _browse_directory(self):
         """Browse for download directory"""
         directory = QFileDialog.getExistingDirectory(
             self,
             "ダウンロード保存先を選択",
-            str(settings.DOWNLOAD_DIR)
+            settings.download_dir_str
         )
 
         if directory:
@@ -145,21 +244,18 @@ class SettingsTab(QWidget):
 
         if file_path:
             try:
-                import asyncio
-                from gui.main_window import MainWindow
-                parent = self.window()
-                if isinstance(parent, MainWindow) and parent.service_thread and parent.service_thread.loop:
+                loop = self._get_loop()
+                if loop:
                     future = asyncio.run_coroutine_threadsafe(
-                        self.auth_manager.authenticate_google(file_path),
-                        parent.service_thread.loop
+                        asyncio.wait_for(
+                            self.auth_manager.authenticate_google(file_path),
+                            self.LOGIN_TIMEOUT
+                        ),
+                        loop
                     )
-                    success = future.result(timeout=60)
-
-                    if success:
-                        self.auth_status_label.setText("認証状態: 認証済み")
-                        QMessageBox.information(self, "成功", "認証に成功しました")
-                    else:
-                        QMessageBox.warning(self, "エラー", "認証に失敗しました")
+                    self.login_button.setEnabled(False)
+                    self.auth_status_label.setText("認証状態: 認証中...")
+                    future.add_done_callback(self._emit_login_finished)
                 else:
                     raise RuntimeError("イベントループが初期化されていません")
 
@@ -167,6 +263,32 @@ class SettingsTab(QWidget):
                 QMessageBox.critical(self, "エラー", f"認証中にエラーが発生しました:\n{str(e)}")
                 logger.error(f"Login error: {e}", exc_info=True)
 
+    def _emit_login_finished(self, future):
+        """Forward the authentication result to the GUI thread"""
+        try:
+            self.login_finished.emit(bool(future.result()), "")
+        except asyncio.TimeoutError:
+            logger.error("Login timed out")
+            self.login_finished.emit(False, "認証がタイムアウトしました")
+        except Exception as e:
+            logger.error(f"Login error: {e}", exc_info=True)
+            self.login_finished.emit(False, str(e))
+
+    def _on_login_finished(self, success: bool, error: str):
+        """Handle completion of Google authentication"""
+        self.login_button.setEnabled(True)
+
+        if success:
+            self.auth_status_label.setText("認証状態: 認証済み")
+            QMessageBox.information(self, "成功", "認証に成功しました")
+            return
+
+        self.auth_status_label.setText("認証状態: 未認証")
+        if error:
+            QMessageBox.critical(self, "エラー", f"認証中にエラーが発生しました:\n{error}")
+        else:
+            QMessageBox.warning(self, "エラー", "認証に失敗しました")
+
     def _logout(self):
         """Logout"""
         if not self.auth_manager:
@@ -178,46 +300,108 @@ class SettingsTab(QWidget):
 
     def _save_settings(self):
         """Save settings"""
-        try:
-            # Update settings
-            settings.DOWNLOAD_DIR = self.download_dir_input.text()
-            settings.MAX_CONCURRENT_DOWNLOADS = self.concurrent_spin.value()
-            settings.ENABLE_GPU = self.gpu_checkbox.isChecked()
-
-            # Save to database
-            if self.db_manager:
-                self.db_manager.set_setting('download_dir', str(settings.DOWNLOAD_DIR))
-                self.db_manager.set_setting('max_concurrent_downloads', settings.MAX_CONCURRENT_DOWNLOADS)
-                self.db_manager.set_setting('enable_gpu', settings.ENABLE_GPU)
+        invalid_proxies = settings.unsupported_proxies()
+        if invalid_proxies:
+            QMessageBox.warning(
+                self,
+                "警告",
+                f"未対応のプロキシ形式です: {', '.join(invalid_proxies)}"
+            )
 
-            QMessageBox.information(self, "成功", "設定を保存しました")
+        try:
+            # Save only edited settings whose value differs from the snapshot
+            pending = {}
+            changes = {}
+            for key, db_key, widget, getter in self._field_map:
+                if key not in self._dirty:
+                    continue
+                value = getter(widget)
+                if self._cfg.get(key) != value:
+                    pending[key] = value
+                    changes[db_key] = value
+
+            if not changes or not self.db_manager:
+                self._apply_settings(pending)
+                self._dirty.clear()
+                QMessageBox.information(self, "成功", "設定を保存しました")
+                return
+
+            # Save to database on a worker thread; the staged values travel
+            # with the task and are applied in _on_settings_saved
+            self.save_button.setEnabled(False)
+            task = _SaveSettingsTask(self.db_manager, changes, pending)
+            task.signals.finished.connect(self._on_settings_saved)
+            QThreadPool.globalInstance().start(task)
 
         except Exception as e:
             QMessageBox.critical(self, "エラー", f"設定の保存に失敗しました:\n{str(e)}")
             logger.error(f"Failed to save settings: {e}")
 
+    def _on_settings_saved(self, success: bool, error: str, pending: dict):
+        """Handle completion of the background settings save"""
+        self.save_button.setEnabled(True)
+        if success:
+            self._apply_settings(pending)
+            # Keys edited again while saving stay dirty; failed saves keep all
+            for key, _, widget, getter in self._field_map:
+                if key in pending and getter(widget) == pending[key]:
+                    self._dirty.discard(key)
+            QMessageBox.information(self, "成功", "設定を保存しました")
+        else:
+            QMessageBox.critical(self, "エラー", f"設定の保存に失敗しました:\n{error}")
+
+    def _apply_settings(self, values):
+        """Apply saved values to settings and the snapshot"""
+        for key, value in values.items():
+            setattr(settings, key, value)
+            self._cfg[key] = value
+
     def _load_settings(self):
         """Load settings from database"""
-        if not self.db_manager:
+        if not self.db_manager or not self._ui_built:
             return
 
+        # Suppress change signals while values are set programmatically
+        blockers = [
+            QSignalBlocker(widget) for widget in (
+                self.download_dir_input, self.concurrent_spin,
+                self.gpu_checkbox, self.gpu_encoder_combo
+            )
+        ]
         try:
-            # Load from database
-            download_dir = self.db_manager.get_setting('download_dir')
-            if download_dir:
+            # Load from database in one query
+            stored = self.db_manager.get_all_settings()
+
+            # Setters are skipped when the widget already shows the value
+            download_dir = stored.get('download_dir')
+            if download_dir and self.download_dir_input.text() != download_dir:
                 self.download_dir_input.setText(download_dir)
 
-            max_concurrent = self.db_manager.get_setting('max_concurrent_downloads')
-            if max_concurrent:
+            max_concurrent = stored.get('max_concurrent_downloads')
+            if max_concurrent and self.concurrent_spin.value() != int(max_concurrent):
                 self.concurrent_spin.setValue(int(max_concurrent))
 
-            enable_gpu = self.db_manager.get_setting('enable_gpu')
-            if enable_gpu is not None:
+            enable_gpu = stored.get('enable_gpu')
+            if enable_gpu is not None and self.gpu_checkbox.isChecked() != bool(enable_gpu):
                 self.gpu_checkbox.setChecked(bool(enable_gpu))
 
+            gpu_encoder = stored.get('gpu_encoder')
+            if gpu_encoder:
+                self._select_gpu_encoder(gpu_encoder)
+
+            # Apply the persisted values so later saves diff against them
+            for key, _, widget, getter in self._field_map:
+                value = getter(widget)
+                if self._cfg.get(key) != value:
+                    setattr(settings, key, value)
+                    self._cfg[key] = value
+
             # Update auth status
             if self.auth_manager and self.auth_manager.is_authenticated():
                 self.auth_status_label.setText("認証状態: 認証済み")
 
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
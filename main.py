@@ -7,6 +7,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 
+def install_uvloop():
+    """Use uvloop for asyncio event loops when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    import asyncio
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def run_gui():
     """Run GUI application"""
     from gui.main_window import main
@@ -22,6 +33,7 @@ def run_api():
 def run_cli(args):
     """Run CLI application"""
     import asyncio
+    from core.event_bus import event_bus
     from core.service_manager import service_manager, ServiceConfig
     from database.db_manager import DatabaseManager
     from modules.download_manager import DownloadManager
@@ -39,12 +51,16 @@ def run_cli(args):
         print(f"Downloading: {url}")
         task = await download_manager.add_download(url)
 
-        # Wait for completion
-        while task.status.value in ['pending', 'downloading', 'processing']:
-            await asyncio.sleep(1)
-            status = download_manager.get_download_status(task.id)
-            if status:
-                print(f"Progress: {status['progress']:.1f}% - Speed: {status['speed']/1024/1024:.2f} MB/s")
+        # Print progress events until the task reaches a final state
+        def on_progress(data):
+            if data['task_id'] == task.id:
+                print(f"Progress: {data['progress']:.1f}% - Speed: {data['speed']/1024/1024:.2f} MB/s")
+
+        event_bus.on('downloadmanager:progress', on_progress)
+        try:
+            await task.done.wait()
+        finally:
+            event_bus.off('downloadmanager:progress', on_progress)
 
         print(f"Download completed: {task.status.value}")
 
@@ -78,6 +94,8 @@ def main():
 
     args = parser.parse_args()
 
+    install_uvloop()
+
     if args.mode == 'gui':
         run_gui()
     elif args.mode == 'api':
@@ -1,22 +1,44 @@
 """Authentication manager for Google OAuth and cookie management"""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 import os
-import pickle
+import json
+import asyncio
+import time
 from pathlib import Path
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+import aiofiles
 
 from core.service_manager import BaseService, ServiceConfig
 from config.settings import settings
 from utils.logger import logger
 
 
+# Google auth libraries are imported where used to keep startup light
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+
+# Netscape cookie file line: domain, subdomains, path, secure, expires, name, value
+_COOKIE_LINE_FORMAT = "%s\t%s\t%s\t%s\t%d\t%s\t%s\n"
+
+# (browser_cookie3 loader name, display name) in default try order
+_COOKIE_BROWSERS = (
+    ('chrome', 'Chrome'),
+    ('firefox', 'Firefox'),
+    ('edge', 'Edge'),
+)
+
+
 class AuthManager(BaseService):
     """Authentication manager"""
 
     SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
 
+    # Seconds an exported cookie file is reused before re-reading the browser
+    COOKIE_TTL = 300
+
+    # Seconds the browser consent flow waits for the OAuth redirect
+    AUTH_TIMEOUT = 300
+
     def __init__(self, config: ServiceConfig):
         """Initialize auth manager
 
@@ -24,36 +46,58 @@ class AuthManager(BaseService):
             config: Service configuration
         """
         super().__init__(config, "AuthManager")
-        self.credentials: Optional[Credentials] = None
-        self.token_file = settings.DATA_DIR / 'token.pickle'
+        self.credentials: Optional['Credentials'] = None
+        self.token_file = settings.DATA_DIR / 'token.json'
+        self._legacy_token_file = settings.DATA_DIR / 'token.pickle'
         self.cookies: Dict[str, Any] = {}
+        self.cookie_file = settings.DATA_DIR / 'youtube_cookies.txt'
+        self._last_browser: Optional[str] = None
 
     async def start(self) -> None:
         """Start auth manager"""
         logger.info("Starting Auth Manager...")
         # Auto-load credentials if available
+        self._migrate_legacy_token()
         if self.token_file.exists():
-            self._load_credentials()
+            await self._load_credentials_async()
 
     async def stop(self) -> None:
         """Stop auth manager"""
         logger.info("Stopping Auth Manager...")
 
-    def _load_credentials(self) -> bool:
-        """Load credentials from file
+    async def _load_credentials_async(self) -> bool:
+        """Load credentials from file without blocking the event loop
 
         Returns:
             True if successful
         """
         try:
-            with open(self.token_file, 'rb') as token:
-                self.credentials = pickle.load(token)
+            from google.oauth2.credentials import Credentials
+
+            async with aiofiles.open(self.token_file, 'r', encoding='utf-8') as token:
+                data = await token.read()
+            self.credentials = Credentials.from_authorized_user_info(json.loads(data), self.SCOPES)
             logger.info("Loaded saved credentials")
             return True
+        except (ValueError, json.JSONDecodeError) as e:
+            self._discard_token_file(e)
+            return False
         except Exception as e:
             logger.error(f"Failed to load credentials: {e}")
             return False
 
+    def _discard_token_file(self, error: Exception) -> None:
+        """Delete an unreadable token file (e.g. truncated or missing refresh_token)
+
+        Args:
+            error: Error raised while parsing the file
+        """
+        logger.warning(f"Discarding unreadable credentials file: {error}")
+        try:
+            self.token_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"Failed to delete credentials file: {e}")
+
     def _save_credentials(self) -> bool:
         """Save credentials to file
 
@@ -61,14 +105,45 @@ class AuthManager(BaseService):
             True if successful
         """
         try:
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(self.credentials, token)
+            self.token_file.write_text(self.credentials.to_json(), encoding='utf-8')
             logger.info("Saved credentials")
             return True
         except Exception as e:
             logger.error(f"Failed to save credentials: {e}")
             return False
 
+    async def _save_credentials_async(self) -> bool:
+        """Save credentials to file without blocking the event loop
+
+        Returns:
+            True if successful
+        """
+        try:
+            async with aiofiles.open(self.token_file, 'w', encoding='utf-8') as token:
+                await token.write(self.credentials.to_json())
+            logger.info("Saved credentials")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save credentials: {e}")
+            return False
+
+    def _migrate_legacy_token(self) -> None:
+        """Convert a token.pickle from older versions to token.json once"""
+        if not self._legacy_token_file.exists():
+            return
+
+        try:
+            if not self.token_file.exists():
+                import pickle
+                with open(self._legacy_token_file, 'rb') as token:
+                    self.credentials = pickle.load(token)
+                if not self._save_credentials():
+                    return
+                logger.info("Migrated credentials to token.json")
+            self._legacy_token_file.unlink()
+        except Exception as e:
+            logger.error(f"Failed to migrate credentials: {e}")
+
     async def authenticate_google(self, client_secrets_file: str) -> bool:
         """Authenticate with Google OAuth
 
@@ -78,18 +153,31 @@ class AuthManager(BaseService):
         Returns:
             True if successful
         """
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        # Network-bound calls below run in the default executor
+        loop = asyncio.get_running_loop()
         creds = None
 
         # Load existing credentials
+        self._migrate_legacy_token()
         if self.token_file.exists():
-            with open(self.token_file, 'rb') as token:
-                creds = pickle.load(token)
+            async with aiofiles.open(self.token_file, 'r', encoding='utf-8') as token:
+                data = await token.read()
+            try:
+                creds = Credentials.from_authorized_user_info(json.loads(data), self.SCOPES)
+            except (ValueError, json.JSONDecodeError) as e:
+                # Run the consent flow again instead of failing every login
+                self._discard_token_file(e)
+                creds = None
 
         # Refresh or create new credentials
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 try:
-                    creds.refresh(Request())
+                    await loop.run_in_executor(None, creds.refresh, Request())
                     logger.info("Refreshed Google credentials")
                 except Exception as e:
                     logger.error(f"Failed to refresh credentials: {e}")
@@ -102,14 +190,24 @@ class AuthManager(BaseService):
                         client_secrets_file,
                         self.SCOPES
                     )
-                    creds = flow.run_local_server(port=0)
+                    creds = await loop.run_in_executor(
+                        None,
+                        lambda: flow.run_local_server(
+                            port=0,
+                            timeout_seconds=self.AUTH_TIMEOUT
+                        )
+                    )
+                    if not creds:
+                        logger.error("Google authentication timed out")
+                        return False
                     logger.info("Completed Google authentication")
                 except Exception as e:
                     logger.error(f"Failed to authenticate: {e}")
                     return False
 
             # Save credentials
-            self._save_credentials()
+            self.credentials = creds
+            await self._save_credentials_async()
 
         self.credentials = creds
         return True
@@ -120,37 +218,29 @@ class AuthManager(BaseService):
         Returns:
             Cookie file path or None
         """
+        # Reuse a recent export instead of re-reading the browser cookie DB;
+        # the file mtime keeps the cache valid across restarts
+        try:
+            if time.time() - self.cookie_file.stat().st_mtime < self.COOKIE_TTL:
+                return str(self.cookie_file)
+        except FileNotFoundError:
+            pass
+
         try:
             import browser_cookie3
 
-            cookie_file = settings.DATA_DIR / 'youtube_cookies.txt'
+            # Try the browser that worked last time first
+            browsers = sorted(_COOKIE_BROWSERS, key=lambda b: b[0] != self._last_browser)
+            for name, label in browsers:
+                try:
+                    cookies = getattr(browser_cookie3, name)(domain_name='youtube.com')
+                    self._save_cookies_netscape(cookies, self.cookie_file)
+                except Exception:
+                    continue
 
-            # Try to get cookies from Chrome
-            try:
-                cookies = browser_cookie3.chrome(domain_name='youtube.com')
-                self._save_cookies_netscape(cookies, cookie_file)
-                logger.info("Loaded cookies from Chrome")
-                return str(cookie_file)
-            except:
-                pass
-
-            # Try Firefox
-            try:
-                cookies = browser_cookie3.firefox(domain_name='youtube.com')
-                self._save_cookies_netscape(cookies, cookie_file)
-                logger.info("Loaded cookies from Firefox")
-                return str(cookie_file)
-            except:
-                pass
-
-            # Try Edge
-            try:
-                cookies = browser_cookie3.edge(domain_name='youtube.com')
-                self._save_cookies_netscape(cookies, cookie_file)
-                logger.info("Loaded cookies from Edge")
-                return str(cookie_file)
-            except:
-                pass
+                self._last_browser = name
+                logger.info(f"Loaded cookies from {label}")
+                return str(self.cookie_file)
 
             logger.warning("Could not load cookies from any browser")
             return None
@@ -169,17 +259,17 @@ class AuthManager(BaseService):
             cookies: Cookie jar
             filename: Output file path
         """
-        with open(filename, 'w') as f:
-            f.write("# Netscape HTTP Cookie File\n")
-            for cookie in cookies:
-                if 'youtube.com' in cookie.domain:
-                    f.write(f"{cookie.domain}\t"
-                           f"{'TRUE' if cookie.domain.startswith('.') else 'FALSE'}\t"
-                           f"{cookie.path}\t"
-                           f"{'TRUE' if cookie.secure else 'FALSE'}\t"
-                           f"{cookie.expires if cookie.expires else 0}\t"
-                           f"{cookie.name}\t"
-                           f"{cookie.value}\n")
+        # Cookies are already filtered by domain_name when loaded
+        flag = ('FALSE', 'TRUE')
+        lines = ["# Netscape HTTP Cookie File\n"]
+        lines.extend(
+            _COOKIE_LINE_FORMAT % (
+                cookie.domain, flag[cookie.domain.startswith('.')], cookie.path,
+                flag[bool(cookie.secure)], cookie.expires or 0, cookie.name, cookie.value
+            )
+            for cookie in cookies
+        )
+        filename.write_text(''.join(lines))
 
     def is_authenticated(self) -> bool:
         """Check if authenticated
@@ -194,4 +284,9 @@ class AuthManager(BaseService):
         self.credentials = None
         if self.token_file.exists():
             self.token_file.unlink()
+
+        # Drop exported browser cookies so they are not reused
+        self.cookies.clear()
+        if self.cookie_file.exists():
+            self.cookie_file.unlink()
         logger.info("Logged out")
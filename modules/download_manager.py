@@ -1,11 +1,19 @@
 """Download manager for handling YouTube downloads"""
 import asyncio
+import copy
+import functools
+import heapq
+import itertools
 from typing import List, Optional, Dict, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from datetime import datetime
 from pathlib import Path
 import uuid
+import time
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 import yt_dlp
 
@@ -15,6 +23,27 @@ from config.settings import settings
 from utils.logger import logger
 
 
+# yt-dlp options for info-only extraction
+_INFO_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _output_template(output_path: str) -> str:
+    """Build the yt-dlp output template for a directory
+
+    Args:
+        output_path: Output directory path
+
+    Returns:
+        Output template string
+    """
+    return str(Path(output_path) / '%(title)s.%(ext)s')
+
+
 class DownloadStatus(Enum):
     """Download status enumeration"""
     PENDING = "pending"
@@ -26,7 +55,46 @@ class DownloadStatus(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+# Statuses of tasks still executing whose progress is no longer reported
+_HALTED_STATUSES = (DownloadStatus.PAUSED, DownloadStatus.CANCELLED)
+
+
+# Info dict keys kept on DownloadTask.metadata for the task's lifetime
+_METADATA_KEEP = frozenset({
+    'id', 'title', 'uploader', 'channel', 'channel_id', 'duration', 'upload_date',
+    'description', 'view_count', 'thumbnail', 'webpage_url', 'ext',
+})
+
+
+# Info dict keys stored with the download history
+_HISTORY_FIELDS = (
+    'title', 'description', 'uploader', 'channel', 'channel_id', 'channel_url',
+    'duration', 'upload_date', 'format', 'resolution', 'fps', 'vcodec', 'acodec',
+    'thumbnail', 'view_count', 'like_count', 'webpage_url',
+)
+
+
+def _pick_metadata(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the metadata kept on a task from a yt-dlp info dict
+
+    Args:
+        info: yt-dlp info dictionary
+
+    Returns:
+        Metadata dictionary
+    """
+    return {k: info[k] for k in _METADATA_KEEP if k in info}
+
+
+# DownloadTask fields copied as-is by to_dict (status and datetimes are converted)
+_TASK_DICT_FIELDS = (
+    'id', 'url', 'output_path', 'format_id', 'quality', 'progress', 'speed', 'eta',
+    'downloaded_bytes', 'total_bytes', 'error_message', 'retry_count', 'priority', 'metadata',
+)
+_get_task_dict_fields = attrgetter(*_TASK_DICT_FIELDS)
+
+
+@dataclass(slots=True)
 class DownloadTask:
     """Download task data class"""
     id: str
@@ -47,34 +115,47 @@ class DownloadTask:
     created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    # time.monotonic() of the last progress event, for throttling
+    last_progress_emit: float = field(default=0.0, repr=False, compare=False)
+    # Whole percent reported by the last progress event
+    last_progress_pct: int = field(default=-1, repr=False, compare=False)
+    # Set once the task reaches a final state (completed, failed, cancelled)
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            'id': self.id,
-            'url': self.url,
-            'output_path': self.output_path,
-            'format_id': self.format_id,
-            'quality': self.quality,
-            'status': self.status.value,
-            'progress': self.progress,
-            'speed': self.speed,
-            'eta': self.eta,
-            'downloaded_bytes': self.downloaded_bytes,
-            'total_bytes': self.total_bytes,
-            'error_message': self.error_message,
-            'retry_count': self.retry_count,
-            'priority': self.priority,
-            'metadata': self.metadata,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-        }
+        data = dict(zip(_TASK_DICT_FIELDS, _get_task_dict_fields(self)))
+        data['status'] = self.status.value
+        data['created_at'] = self.created_at.isoformat() if self.created_at else None
+        data['started_at'] = self.started_at.isoformat() if self.started_at else None
+        data['completed_at'] = self.completed_at.isoformat() if self.completed_at else None
+        return data
 
 
 class DownloadManager(BaseService):
     """Download manager service"""
 
+    # Minimum seconds between progress events for one task
+    PROGRESS_EMIT_INTERVAL = 0.25
+
+    # Threads for yt-dlp info extraction (network-bound)
+    EXTRACT_WORKERS = 32
+
+    # Seconds get_video_info results (and failures) are reused
+    INFO_CACHE_TTL = 300
+    INFO_CACHE_ERROR_TTL = 30
+    # Maximum cached get_video_info results (full info dicts are large)
+    INFO_CACHE_SIZE = 128
+
+    # Seconds status updates are collected before one batched commit
+    DB_FLUSH_INTERVAL = 0.1
+
+    # Finished tasks kept in memory for get_download_status
+    FINISHED_CACHE_SIZE = 256
+
+    # Seconds stop() lets busy workers finish before cancelling them
+    SHUTDOWN_TIMEOUT = 5.0
+
     def __init__(
         self,
         config: ServiceConfig,
@@ -88,53 +169,81 @@ class DownloadManager(BaseService):
         """
         super().__init__(config, "DownloadManager")
         self.db_manager = db_manager
-        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        # Pending tasks as a heap of (-priority, seq, task); the sequence
+        # number keeps FIFO order within a priority and never ties
+        self._heap: List[tuple] = []
+        self._queue_seq = itertools.count()
+        self._queue_cond = asyncio.Condition()
         self.active_downloads: Dict[str, DownloadTask] = {}
         self.paused_downloads: Dict[str, DownloadTask] = {}
-        self.executor = ThreadPoolExecutor(max_workers=config.max_workers)
+        # Recently finished tasks, oldest first; the DB row can lag behind
+        self._finished: "OrderedDict[str, DownloadTask]" = OrderedDict()
+        # Downloads and info extraction use separate pools so metadata
+        # lookups are not starved by long-running downloads
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.max_workers,
+            thread_name_prefix='ydl-dl'
+        )
+        self._extract_executor = ThreadPoolExecutor(
+            max_workers=self.EXTRACT_WORKERS,
+            thread_name_prefix='ydl-extract'
+        )
+        # Single thread for all DB access (see _run_db)
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='db-write'
+        )
         self.workers: List[asyncio.Task] = []
         self._shutdown_event = asyncio.Event()
 
-    def _get_default_ydl_opts(self, task: DownloadTask) -> Dict[str, Any]:
-        """Get default yt-dlp options
+        # URLs already in the download history, loaded in start()
+        self._known_urls: Optional[set] = None
 
-        Args:
-            task: Download task
+        # Queue status updates waiting for the batched DB flush
+        self._db_writes: asyncio.Queue = asyncio.Queue()
+        self._db_flusher: Optional[asyncio.Task] = None
 
-        Returns:
-            yt-dlp options dictionary
-        """
-        output_template = str(Path(task.output_path) / '%(title)s.%(ext)s')
-
-        # More flexible format selection
-        if task.format_id:
-            format_str = task.format_id
-        else:
-            # Default: best quality with fallbacks
-            format_str = 'bestvideo+bestaudio/best'
-
-        opts = {
-            'format': format_str,
-            'outtmpl': output_template,
-            'progress_hooks': [lambda d: self._progress_hook(task.id, d)],
-            'postprocessor_hooks': [lambda d: self._postprocessor_hook(task.id, d)],
+        # yt-dlp options shared by every task
+        self._static_ydl_opts: Dict[str, Any] = {
             'concurrent_fragment_downloads': settings.FRAGMENT_DOWNLOADS,
             'nocheckcertificate': True,
             'quiet': not settings.DEBUG,
             'no_warnings': not settings.DEBUG,
             'extract_flat': False,
             'ignoreerrors': False,
-            'retries': self.config.retry_count,
-            'fragment_retries': self.config.retry_count,
-            'socket_timeout': self.config.timeout,
+            'retries': config.retry_count,
+            'fragment_retries': config.retry_count,
+            'socket_timeout': config.timeout,
             'merge_output_format': 'mp4',  # Merge to mp4 if needed
         }
-
         # Add proxy if configured
         if settings.HTTP_PROXY:
-            opts['proxy'] = settings.HTTP_PROXY
+            self._static_ydl_opts['proxy'] = settings.HTTP_PROXY
+
+        # One info-extraction YoutubeDL per extract thread (not thread-safe)
+        self._ydl_local = threading.local()
+        self._info_ydls: List[yt_dlp.YoutubeDL] = []
+        # url -> (expires_at, info, error) for get_video_info, in LRU order
+        self._info_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _get_default_ydl_opts(self, task: DownloadTask) -> Dict[str, Any]:
+        """Get default yt-dlp options
+
+        Args:
+            task: Download task
 
-        return opts
+        Returns:
+            yt-dlp options dictionary
+        """
+        return {
+            **self._static_ydl_opts,
+            # Default: best quality with fallbacks
+            'format': task.format_id or 'bestvideo+bestaudio/best',
+            'outtmpl': _output_template(task.output_path),
+            # Bind the ID only so yt-dlp's hook lists do not keep the task alive
+            'progress_hooks': [functools.partial(self._progress_hook, task.id)],
+            'postprocessor_hooks': [functools.partial(self._postprocessor_hook, task.id)],
+        }
 
     def _progress_hook(self, task_id: str, d: Dict[str, Any]) -> None:
         """Progress hook for yt-dlp
@@ -143,12 +252,15 @@ class DownloadManager(BaseService):
             task_id: Task ID
             d: Progress data
         """
-        if task_id not in self.active_downloads:
+        task = self.active_downloads.get(task_id)
+        if task is None or task.status in _HALTED_STATUSES:
             return
 
-        task = self.active_downloads[task_id]
-
         if d['status'] == 'downloading':
+            # Show the title while downloading; info is only returned at the end
+            if not task.metadata and d.get('info_dict'):
+                task.metadata = _pick_metadata(d['info_dict'])
+
             task.downloaded_bytes = d.get('downloaded_bytes', 0)
             task.total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
 
@@ -158,21 +270,41 @@ class DownloadManager(BaseService):
             task.speed = d.get('speed', 0) or 0
             task.eta = d.get('eta')
 
-            # Emit progress event
-            self.emit_event('progress', {
-                'task_id': task_id,
-                'progress': task.progress,
-                'speed': task.speed,
-                'eta': task.eta,
-                'downloaded_bytes': task.downloaded_bytes,
-                'total_bytes': task.total_bytes,
-            })
+            # Throttle events to the interval or a new whole percent;
+            # the task fields above stay current regardless
+            now = time.monotonic()
+            pct = int(task.progress)
+            if (now - task.last_progress_emit < self.PROGRESS_EMIT_INTERVAL
+                    and pct == task.last_progress_pct):
+                return
+            task.last_progress_emit = now
+            task.last_progress_pct = pct
+
+            self._emit_progress(task)
 
         elif d['status'] == 'finished':
             task.progress = 100.0
             task.status = DownloadStatus.PROCESSING
+            # Always report the final 100%
+            task.last_progress_pct = 100
+            self._emit_progress(task)
             logger.info(f"Download finished, now processing: {task.metadata.get('title', task.url)}")
 
+    def _emit_progress(self, task: DownloadTask) -> None:
+        """Emit a progress event for a task
+
+        Args:
+            task: Download task
+        """
+        self.emit_event('progress', {
+            'task_id': task.id,
+            'progress': task.progress,
+            'speed': task.speed,
+            'eta': task.eta,
+            'downloaded_bytes': task.downloaded_bytes,
+            'total_bytes': task.total_bytes,
+        })
+
     def _postprocessor_hook(self, task_id: str, d: Dict[str, Any]) -> None:
         """Post-processor hook for yt-dlp
 
@@ -183,8 +315,6 @@ class DownloadManager(BaseService):
         if task_id not in self.active_downloads:
             return
 
-        task = self.active_downloads[task_id]
-
         if d['status'] == 'processing':
             logger.info(f"Post-processing: {d.get('postprocessor', 'unknown')}")
 
@@ -192,6 +322,12 @@ class DownloadManager(BaseService):
         """Start download manager"""
         logger.info("Starting Download Manager...")
 
+        # Cache downloaded URLs for duplicate checks
+        self._known_urls = await self._run_db(self.db_manager.get_downloaded_urls)
+
+        # Start batched DB writer
+        self._db_flusher = asyncio.create_task(self._db_flush_loop())
+
         # Start worker tasks
         for i in range(self.config.max_workers):
             worker = asyncio.create_task(self._download_worker(f"worker-{i}"))
@@ -203,20 +339,96 @@ class DownloadManager(BaseService):
         """Stop download manager"""
         logger.info("Stopping Download Manager...")
         self._shutdown_event.set()
-
-        # Cancel all workers
-        for worker in self.workers:
-            worker.cancel()
-
-        # Wait for workers to finish
-        await asyncio.gather(*self.workers, return_exceptions=True)
+        async with self._queue_cond:
+            self._queue_cond.notify_all()
+
+        # Idle workers exit on the notify; cancel only those still busy
+        if self.workers:
+            _, pending = await asyncio.wait(self.workers, timeout=self.SHUTDOWN_TIMEOUT)
+            for worker in pending:
+                worker.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         self.workers.clear()
 
-        # Shutdown executor
+        # Stop the DB writer and commit whatever is still queued
+        if self._db_flusher:
+            self._db_flusher.cancel()
+            await asyncio.gather(self._db_flusher, return_exceptions=True)
+            self._db_flusher = None
+        await self._flush_db_writes([])
+
+        # Shutdown executors
         self.executor.shutdown(wait=True)
+        self._extract_executor.shutdown(wait=True)
+        self._db_executor.shutdown(wait=True)
+
+        # Close cached info extractors
+        for ydl in self._info_ydls:
+            ydl.close()
+        self._info_ydls.clear()
 
         logger.info("Download Manager stopped")
 
+    def _queue_status_update(self, task_id: str, status: str, **kwargs) -> None:
+        """Queue a DB status update for the next batched commit
+
+        Args:
+            task_id: Task ID
+            status: New status
+            **kwargs: Additional fields to update
+        """
+        self._db_writes.put_nowait((task_id, status, kwargs))
+
+    async def _db_flush_loop(self) -> None:
+        """Commit queued status updates in batches"""
+        while True:
+            batch = [await self._db_writes.get()]
+            try:
+                # Let updates from other workers accumulate
+                await asyncio.sleep(self.DB_FLUSH_INTERVAL)
+            finally:
+                await self._flush_db_writes(batch)
+
+    async def _flush_db_writes(self, batch: List[tuple]) -> None:
+        """Drain queued status updates and write them in one transaction on the DB thread
+
+        Args:
+            batch: Updates already taken from the queue
+        """
+        while not self._db_writes.empty():
+            batch.append(self._db_writes.get_nowait())
+
+        if not batch:
+            return
+
+        await self._run_db(self._write_status_updates, batch)
+
+    async def _run_db(self, func: Callable, *args) -> Any:
+        """Run a database call on the DB thread
+
+        All of this service's SQLite access goes through the single DB
+        thread, so calls never block the loop or overlap each other.
+
+        Args:
+            func: Database function
+            *args: Positional arguments
+
+        Returns:
+            Result of the call
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, func, *args)
+
+    def _write_status_updates(self, batch: List[tuple]) -> None:
+        """Write a batch of queue status updates
+
+        Args:
+            batch: List of (task_id, status, fields)
+        """
+        try:
+            self.db_manager.bulk_update_queue_status(batch)
+        except Exception as e:
+            logger.error(f"Failed to write queue status updates: {e}")
+
     async def add_download(
         self,
         url: str,
@@ -237,23 +449,27 @@ class DownloadManager(BaseService):
         Returns:
             Created download task
         """
-        # Check for duplicates
-        if self.db_manager.check_duplicate(url):
+        # Check for duplicates (DB lookup only before start() loaded the cache)
+        if self._known_urls is not None:
+            duplicate = url in self._known_urls
+        else:
+            duplicate = await self._run_db(self.db_manager.check_duplicate, url)
+        if duplicate:
             logger.warning(f"URL already downloaded: {url}")
             raise ValueError("This video has already been downloaded")
 
         # Create task
         task = DownloadTask(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             url=url,
-            output_path=output_path or str(settings.DOWNLOAD_DIR),
+            output_path=output_path or settings.download_dir_str,
             format_id=format_id,
             quality=quality,
             priority=priority
         )
 
-        # Add to database queue
-        self.db_manager.add_to_queue({
+        # Add to database queue (ahead of the task's later status batches)
+        await self._run_db(self.db_manager.add_to_queue, {
             'id': task.id,
             'url': task.url,
             'priority': task.priority,
@@ -262,14 +478,104 @@ class DownloadManager(BaseService):
             'quality': task.quality
         })
 
-        # Add to queue (priority queue uses negative priority for max-heap)
-        await self.queue.put((-priority, task.created_at, task))
+        # Add to queue
+        await self._enqueue(task)
 
         logger.info(f"Added download to queue: {url} (priority: {priority})")
         self.emit_event('download:added', task.to_dict())
 
         return task
 
+    async def add_downloads(
+        self,
+        urls: List[str],
+        output_path: Optional[str] = None,
+        format_id: Optional[str] = None,
+        quality: Optional[str] = None,
+        priority: int = 5
+    ) -> List[DownloadTask]:
+        """Add many downloads to the queue with one DB transaction
+
+        Already downloaded URLs are skipped rather than raising.
+
+        Args:
+            urls: Video URLs
+            output_path: Output directory path
+            format_id: Format ID
+            quality: Quality preference
+            priority: Download priority (1-10, higher is more important)
+
+        Returns:
+            Created download tasks
+        """
+        urls = list(dict.fromkeys(urls))
+        if self._known_urls is not None:
+            duplicates = self._known_urls.intersection(urls)
+        else:
+            duplicates = await self._run_db(self.db_manager.check_duplicates_bulk, urls)
+        if duplicates:
+            logger.info(f"Skipping {len(duplicates)} already downloaded URLs")
+
+        output_path = output_path or settings.download_dir_str
+        created_at = datetime.now()
+        tasks = [
+            DownloadTask(
+                id=uuid.uuid4().hex,
+                url=url,
+                output_path=output_path,
+                format_id=format_id,
+                quality=quality,
+                priority=priority,
+                created_at=created_at
+            )
+            for url in urls if url not in duplicates
+        ]
+        if not tasks:
+            return tasks
+
+        await self._run_db(self.db_manager.add_to_queue_bulk, [
+            {
+                'id': task.id,
+                'url': task.url,
+                'priority': task.priority,
+                'output_path': task.output_path,
+                'format_id': task.format_id,
+                'quality': task.quality
+            }
+            for task in tasks
+        ])
+
+        async with self._queue_cond:
+            for task in tasks:
+                heapq.heappush(self._heap, (-task.priority, next(self._queue_seq), task))
+            self._queue_cond.notify(len(tasks))
+
+        logger.info(f"Added {len(tasks)} downloads to queue (priority: {priority})")
+        self.emit_event('download:added_bulk', {
+            'tasks': [task.to_dict() for task in tasks]
+        })
+
+        return tasks
+
+    async def _enqueue(self, task: DownloadTask) -> None:
+        """Push a task onto the priority heap and wake one worker
+
+        Args:
+            task: Download task
+        """
+        async with self._queue_cond:
+            # Negative priority so the highest priority pops first
+            heapq.heappush(self._heap, (-task.priority, next(self._queue_seq), task))
+            self._queue_cond.notify()
+
+    def queue_size(self) -> int:
+        """Get the number of queued tasks
+
+        Returns:
+            Number of tasks waiting for a worker
+        """
+        return len(self._heap)
+
     async def _download_worker(self, worker_id: str) -> None:
         """Download worker task
 
@@ -280,14 +586,13 @@ class DownloadManager(BaseService):
 
         while not self._shutdown_event.is_set():
             try:
-                # Get task from queue with timeout
-                try:
-                    _, _, task = await asyncio.wait_for(
-                        self.queue.get(),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
+                # Wait for a task without polling
+                async with self._queue_cond:
+                    while not self._heap and not self._shutdown_event.is_set():
+                        await self._queue_cond.wait()
+                    if not self._heap:
+                        break
+                    _, _, task = heapq.heappop(self._heap)
 
                 # Process task
                 self.active_downloads[task.id] = task
@@ -297,7 +602,7 @@ class DownloadManager(BaseService):
                 logger.info(f"Worker {worker_id} processing: {task.url}")
 
                 # Update database
-                self.db_manager.update_queue_status(
+                self._queue_status_update(
                     task.id,
                     'downloading',
                     started_at=task.started_at
@@ -306,12 +611,12 @@ class DownloadManager(BaseService):
                 # Execute download
                 await self._execute_download(task)
 
-                # Remove from active downloads
-                if task.id in self.active_downloads:
-                    del self.active_downloads[task.id]
-
-                # Mark queue task as done
-                self.queue.task_done()
+                # Remove from active downloads (pause/cancel leave it to us)
+                self.active_downloads.pop(task.id, None)
+                if task.done.is_set():
+                    # A pause that finished anyway leaves nothing to resume
+                    self.paused_downloads.pop(task.id, None)
+                    self._remember_finished(task)
 
             except asyncio.CancelledError:
                 logger.info(f"Worker {worker_id} cancelled")
@@ -327,29 +632,30 @@ class DownloadManager(BaseService):
         Args:
             task: Download task
         """
+        loop = asyncio.get_running_loop()
         try:
             opts = self._get_default_ydl_opts(task)
 
-            # Extract info first
+            # Extract and download in one pass so the info is fetched once
             with yt_dlp.YoutubeDL(opts) as ydl:
-                logger.info(f"Extracting info for: {task.url}")
-                info = await asyncio.get_event_loop().run_in_executor(
+                logger.info(f"Starting download: {task.url}")
+                info = await loop.run_in_executor(
                     self.executor,
                     ydl.extract_info,
                     task.url,
-                    False  # download=False
+                    True  # download=True
                 )
+                # Final path after merging/postprocessing; prepare_filename
+                # only knows the pre-merge name
+                requested = info.get('requested_downloads') or [{}]
+                file_path = requested[0].get('filepath') or ydl.prepare_filename(info)
 
-                task.metadata = info
-                logger.info(f"Extracted info: {info.get('title', 'Unknown')}")
+            task.metadata = _pick_metadata(info)
 
-                # Download
-                logger.info(f"Starting download: {info.get('title', task.url)}")
-                await asyncio.get_event_loop().run_in_executor(
-                    self.executor,
-                    ydl.download,
-                    [task.url]
-                )
+            # Cancelled while yt-dlp was finishing; cancel_download already
+            # recorded the final state
+            if task.status is DownloadStatus.CANCELLED:
+                return
 
             # Mark as completed
             task.status = DownloadStatus.COMPLETED
@@ -359,26 +665,33 @@ class DownloadManager(BaseService):
             logger.info(f"Download completed: {task.metadata.get('title', task.url)}")
 
             # Update database
-            self.db_manager.update_queue_status(
+            self._queue_status_update(
                 task.id,
                 'completed',
                 completed_at=task.completed_at,
                 progress=100.0
             )
 
-            # Add to history
-            download_info = task.metadata.copy()
+            # Add to history with only the fields it stores
+            download_info = {k: info.get(k) for k in _HISTORY_FIELDS}
             download_info.update({
                 'id': task.id,
                 'url': task.url,
-                'file_path': task.output_path,
+                'file_path': file_path,
+                'filesize': info.get('filesize') or info.get('filesize_approx') or task.total_bytes,
             })
-            self.db_manager.add_download_history(download_info)
+            await self._run_db(self.db_manager.add_download_history, download_info)
+            if self._known_urls is not None:
+                self._known_urls.add(task.url)
 
             # Emit completion event
             self.emit_event('download:completed', task.to_dict())
+            task.done.set()
 
         except Exception as e:
+            if task.status is DownloadStatus.CANCELLED:
+                return
+
             task.status = DownloadStatus.FAILED
             task.error_message = str(e)
             task.completed_at = datetime.now()
@@ -387,7 +700,7 @@ class DownloadManager(BaseService):
             logger.error(f"Download failed: {task.url} - {e}")
 
             # Update database
-            self.db_manager.update_queue_status(
+            self._queue_status_update(
                 task.id,
                 'failed',
                 completed_at=task.completed_at,
@@ -401,7 +714,9 @@ class DownloadManager(BaseService):
             if task.retry_count < self.config.retry_count:
                 logger.info(f"Retrying download ({task.retry_count}/{self.config.retry_count}): {task.url}")
                 await asyncio.sleep(2 ** task.retry_count)  # Exponential backoff
-                await self.queue.put((-task.priority, task.created_at, task))
+                await self._enqueue(task)
+            else:
+                task.done.set()
 
     async def pause_download(self, task_id: str) -> bool:
         """Pause a download
@@ -412,13 +727,13 @@ class DownloadManager(BaseService):
         Returns:
             True if successful
         """
-        if task_id in self.active_downloads:
-            task = self.active_downloads[task_id]
+        task = self.active_downloads.get(task_id)
+        if task and task.status not in _HALTED_STATUSES:
+            # The worker removes it from active_downloads when it returns
             task.status = DownloadStatus.PAUSED
             self.paused_downloads[task_id] = task
-            del self.active_downloads[task_id]
 
-            self.db_manager.update_queue_status(task_id, 'paused')
+            self._queue_status_update(task_id, 'paused')
             logger.info(f"Paused download: {task_id}")
             return True
 
@@ -434,12 +749,18 @@ class DownloadManager(BaseService):
             True if successful
         """
         if task_id in self.paused_downloads:
-            task = self.paused_downloads[task_id]
-            task.status = DownloadStatus.PENDING
-            del self.paused_downloads[task_id]
+            task = self.paused_downloads.pop(task_id)
+            if task.done.is_set():
+                return False
 
-            await self.queue.put((-task.priority, task.created_at, task))
-            self.db_manager.update_queue_status(task_id, 'pending')
+            if task_id in self.active_downloads:
+                # Still executing, so just report progress again
+                task.status = DownloadStatus.DOWNLOADING
+                self._queue_status_update(task_id, 'downloading')
+            else:
+                task.status = DownloadStatus.PENDING
+                await self._enqueue(task)
+                self._queue_status_update(task_id, 'pending')
 
             logger.info(f"Resumed download: {task_id}")
             return True
@@ -455,20 +776,24 @@ class DownloadManager(BaseService):
         Returns:
             True if successful
         """
-        # Check active downloads
-        if task_id in self.active_downloads:
-            task = self.active_downloads[task_id]
+        # Check active downloads (the worker removes the entry when it returns)
+        task = self.active_downloads.get(task_id)
+        if task and task.status is not DownloadStatus.CANCELLED:
             task.status = DownloadStatus.CANCELLED
-            del self.active_downloads[task_id]
+            task.done.set()
+            self.paused_downloads.pop(task_id, None)
 
-            self.db_manager.update_queue_status(task_id, 'cancelled')
+            self._queue_status_update(task_id, 'cancelled')
             logger.info(f"Cancelled active download: {task_id}")
             return True
 
         # Check paused downloads
         if task_id in self.paused_downloads:
-            del self.paused_downloads[task_id]
-            self.db_manager.update_queue_status(task_id, 'cancelled')
+            task = self.paused_downloads.pop(task_id)
+            task.status = DownloadStatus.CANCELLED
+            task.done.set()
+            self._remember_finished(task)
+            self._queue_status_update(task_id, 'cancelled')
             logger.info(f"Cancelled paused download: {task_id}")
             return True
 
@@ -482,7 +807,17 @@ class DownloadManager(BaseService):
         """
         return [task.to_dict() for task in self.active_downloads.values()]
 
-    def get_download_status(self, task_id: str) -> Optional[Dict[str, Any]]:
+    def _remember_finished(self, task: DownloadTask) -> None:
+        """Keep a finished task for status lookups, evicting the oldest
+
+        Args:
+            task: Download task in a final state
+        """
+        self._finished[task.id] = task
+        while len(self._finished) > self.FINISHED_CACHE_SIZE:
+            self._finished.popitem(last=False)
+
+    async def get_download_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get download status
 
         Args:
@@ -497,7 +832,12 @@ class DownloadManager(BaseService):
         if task_id in self.paused_downloads:
             return self.paused_downloads[task_id].to_dict()
 
-        return None
+        if task_id in self._finished:
+            return self._finished[task_id].to_dict()
+
+        # Queued and older tasks are only tracked in the database; the DB
+        # thread also serializes this read after any in-flight status writes
+        return await self._run_db(self.db_manager.get_queue_item, task_id)
 
     async def get_video_info(self, url: str) -> Dict[str, Any]:
         """Get video information without downloading
@@ -508,18 +848,77 @@ class DownloadManager(BaseService):
         Returns:
             Video information dictionary
         """
-        opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-        }
+        now = time.monotonic()
+        cached = self._info_cache.get(url)
+        if cached:
+            if cached[0] > now:
+                self._info_cache.move_to_end(url)
+                _, info, error = cached
+                if error:
+                    # Fresh copy so tracebacks do not pile up on the cached one
+                    raise copy.copy(error)
+                return info
+            del self._info_cache[url]
 
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                ydl.extract_info,
-                url,
-                False
+        try:
+            info = await asyncio.get_running_loop().run_in_executor(
+                self._extract_executor,
+                self._extract_info,
+                url
             )
+        except Exception as e:
+            # Remember failures briefly to avoid retry storms
+            error = copy.copy(e).with_traceback(None)
+            self._cache_info(url, (now + self.INFO_CACHE_ERROR_TTL, None, error))
+            raise
 
+        self._cache_info(url, (now + self.INFO_CACHE_TTL, info, None))
         return info
+
+    def _cache_info(self, url: str, entry: tuple) -> None:
+        """Store a get_video_info result, evicting the least recently used
+
+        Args:
+            url: Video URL
+            entry: (expires_at, info, error)
+        """
+        self._info_cache[url] = entry
+        self._info_cache.move_to_end(url)
+        while len(self._info_cache) > self.INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+
+    async def get_flat_info(self, url: str, **opts) -> Optional[Dict[str, Any]]:
+        """Get a flat channel/playlist listing on the extract pool
+
+        Args:
+            url: Channel or playlist URL
+            **opts: Extra yt-dlp options (e.g. playlist_items, playlistend)
+
+        Returns:
+            Listing information dictionary
+        """
+        def extract() -> Optional[Dict[str, Any]]:
+            with yt_dlp.YoutubeDL({'extract_flat': True, 'quiet': True, **opts}) as ydl:
+                return ydl.extract_info(url, download=False)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._extract_executor,
+            extract
+        )
+
+    def _extract_info(self, url: str) -> Dict[str, Any]:
+        """Extract video info with this thread's cached YoutubeDL
+
+        Args:
+            url: Video URL
+
+        Returns:
+            Video information dictionary
+        """
+        ydl = getattr(self._ydl_local, 'info_ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(dict(_INFO_OPTS))
+            self._ydl_local.info_ydl = ydl
+            self._info_ydls.append(ydl)
+
+        return ydl.extract_info(url, download=False)
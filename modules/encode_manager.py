@@ -10,6 +10,30 @@ from config.settings import settings
 from utils.logger import logger
 
 
+# Software encoder per codec
+_SOFTWARE_ENCODERS = {
+    'h264': 'libx264',
+    'h265': 'libx265',
+    'vp9': 'libvpx-vp9'
+}
+
+# (gpu_available key, encoder per codec, default encoder) in preference order
+_GPU_ENCODERS = (
+    ('nvidia', {'h264': 'h264_nvenc', 'h265': 'hevc_nvenc'}, 'h264_nvenc'),
+    ('intel', {'h264': 'h264_qsv', 'h265': 'hevc_qsv'}, 'h264_qsv'),
+    ('amd', {'h264': 'h264_amf', 'h265': 'hevc_amf'}, 'h264_amf'),
+)
+
+# Audio format -> FFmpeg audio codec
+_AUDIO_CODECS = {
+    'mp3': 'libmp3lame',
+    'aac': 'aac',
+    'flac': 'flac',
+    'opus': 'libopus',
+    'ogg': 'libvorbis'
+}
+
+
 class EncodeManager(BaseService):
     """Encode manager for video/audio processing"""
 
@@ -118,30 +142,12 @@ class EncodeManager(BaseService):
             Encoder name
         """
         if not use_gpu or not settings.ENABLE_GPU:
-            return {
-                'h264': 'libx264',
-                'h265': 'libx265',
-                'vp9': 'libvpx-vp9'
-            }.get(codec, 'libx264')
+            return _SOFTWARE_ENCODERS.get(codec, 'libx264')
 
         # GPU encoder selection
-        if self.gpu_available.get('nvidia'):
-            return {
-                'h264': 'h264_nvenc',
-                'h265': 'hevc_nvenc'
-            }.get(codec, 'h264_nvenc')
-
-        elif self.gpu_available.get('intel'):
-            return {
-                'h264': 'h264_qsv',
-                'h265': 'hevc_qsv'
-            }.get(codec, 'h264_qsv')
-
-        elif self.gpu_available.get('amd'):
-            return {
-                'h264': 'h264_amf',
-                'h265': 'hevc_amf'
-            }.get(codec, 'h264_amf')
+        for vendor, encoders, default in _GPU_ENCODERS:
+            if self.gpu_available.get(vendor):
+                return encoders.get(codec, default)
 
         # Fallback to software encoding
         return 'libx264'
@@ -212,7 +218,7 @@ class EncodeManager(BaseService):
             stream = ffmpeg.output(stream, output_file, **output_params)
 
             # Execute
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: ffmpeg.run(stream, overwrite_output=True, capture_stderr=True)
             )
@@ -248,24 +254,16 @@ class EncodeManager(BaseService):
         try:
             logger.info(f"Extracting audio: {input_file} -> {output_file}")
 
-            codec_map = {
-                'mp3': 'libmp3lame',
-                'aac': 'aac',
-                'flac': 'flac',
-                'opus': 'libopus',
-                'ogg': 'libvorbis'
-            }
-
             stream = ffmpeg.input(input_file)
             stream = ffmpeg.output(
                 stream,
                 output_file,
-                acodec=codec_map.get(format, 'libmp3lame'),
+                acodec=_AUDIO_CODECS.get(format, 'libmp3lame'),
                 audio_bitrate=bitrate,
                 vn=None  # No video
             )
 
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: ffmpeg.run(stream, overwrite_output=True)
             )
@@ -307,7 +305,7 @@ class EncodeManager(BaseService):
                 acodec='copy'
             )
 
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: ffmpeg.run(stream, overwrite_output=True)
             )
@@ -351,7 +349,7 @@ class EncodeManager(BaseService):
             else:
                 stream = ffmpeg.output(stream, output_file, c='copy')
 
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: ffmpeg.run(stream, overwrite_output=True)
             )
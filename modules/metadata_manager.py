@@ -11,6 +11,16 @@ from database.db_manager import DatabaseManager
 from utils.logger import logger
 
 
+# Filename template variables, substituted in a single pass
+_TEMPLATE_VAR_RE = re.compile(r"\{(title|channel|channel_id|id|date|ext|resolution|fps)\}")
+
+# Invalid filename characters become '_', control characters are dropped
+_FILENAME_TRANSLATION = {
+    **{ord(c): '_' for c in '<>:"/\\|?*'},
+    **dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)]),
+}
+
+
 class MetadataManager(BaseService):
     """Metadata manager for file organization and metadata"""
 
@@ -69,9 +79,7 @@ class MetadataManager(BaseService):
                 pass
 
         # Replace template variables
-        filename = template
-        for key, value in variables.items():
-            filename = filename.replace(f"{{{key}}}", str(value))
+        filename = _TEMPLATE_VAR_RE.sub(lambda m: str(variables[m.group(1)]), template)
 
         # Sanitize filename
         filename = self._sanitize_filename(filename)
@@ -93,12 +101,8 @@ class MetadataManager(BaseService):
         Returns:
             Sanitized filename
         """
-        # Replace invalid characters
-        invalid_chars = r'[<>:"/\\|?*]'
-        filename = re.sub(invalid_chars, '_', filename)
-
-        # Remove control characters
-        filename = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', filename)
+        # Replace invalid characters and remove control characters
+        filename = filename.translate(_FILENAME_TRANSLATION)
 
         # Remove leading/trailing spaces and dots
         filename = filename.strip('. ')
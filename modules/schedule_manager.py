@@ -5,13 +5,30 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 import uuid
-import yt_dlp
 
 from core.service_manager import BaseService, ServiceConfig
 from database.db_manager import DatabaseManager
 from utils.logger import logger
 
 
+def _entry_url(entry: Dict[str, Any]) -> Optional[str]:
+    """Get the video URL of a flat playlist entry
+
+    Args:
+        entry: Flat playlist entry
+
+    Returns:
+        Video URL, or None when the entry has neither url nor id
+    """
+    url = entry.get('url')
+    if url:
+        return url
+    video_id = entry.get('id')
+    if video_id:
+        return f"https://www.youtube.com/watch?v={video_id}"
+    return None
+
+
 class ScheduleManager(BaseService):
     """Schedule manager for automated tasks"""
 
@@ -173,46 +190,39 @@ class ScheduleManager(BaseService):
             raise ValueError("channel_url parameter is required")
 
         # Get channel videos
-        opts = {
-            'extract_flat': True,
-            'quiet': True,
-        }
+        info = await self.download_manager.get_flat_info(channel_url)
+
+        if not info:
+            return
 
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(channel_url, download=False)
-
-            if not info:
-                return
-
-            entries = info.get('entries', [])
-
-            # Filter new videos
-            if last_check:
-                last_check_date = datetime.fromisoformat(last_check) if isinstance(last_check, str) else last_check
-            else:
-                last_check_date = datetime.now() - timedelta(days=1)
-
-            new_videos = []
-            for entry in entries:
-                upload_date_str = entry.get('upload_date')
-                if upload_date_str:
-                    upload_date = datetime.strptime(upload_date_str, '%Y%m%d')
-                    if upload_date > last_check_date:
-                        new_videos.append(entry)
-
-            logger.info(f"Found {len(new_videos)} new videos from channel")
-
-            # Add to download queue
-            for video in new_videos:
-                try:
-                    await self.download_manager.add_download(
-                        url=video['url'],
-                        output_path=params.get('output_path'),
-                        quality=params.get('quality'),
-                        priority=params.get('priority', 5)
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to add video to queue: {e}")
+        entries = info.get('entries', [])
+
+        # Filter new videos
+        if last_check:
+            last_check_date = datetime.fromisoformat(last_check) if isinstance(last_check, str) else last_check
+        else:
+            last_check_date = datetime.now() - timedelta(days=1)
+
+        new_videos = []
+        for entry in entries:
+            upload_date_str = entry.get('upload_date')
+            if upload_date_str:
+                upload_date = datetime.strptime(upload_date_str, '%Y%m%d')
+                if upload_date > last_check_date:
+                    new_videos.append(entry)
+
+        logger.info(f"Found {len(new_videos)} new videos from channel")
+
+        # Add to download queue in one batch
+        try:
+            await self.download_manager.add_downloads(
+                [url for url in map(_entry_url, new_videos) if url],
+                output_path=params.get('output_path'),
+                quality=params.get('quality'),
+                priority=params.get('priority', 5)
+            )
+        except Exception as e:
+            logger.error(f"Failed to add videos to queue: {e}")
 
     async def _download_playlist(self, params: Dict[str, Any]) -> None:
         """Download playlist
@@ -227,34 +237,28 @@ class ScheduleManager(BaseService):
             raise ValueError("playlist_url parameter is required")
 
         # Get playlist videos
-        opts = {
-            'extract_flat': True,
-            'quiet': True,
-        }
-
+        opts = {}
         if playlist_items:
             opts['playlist_items'] = playlist_items
 
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(playlist_url, download=False)
+        info = await self.download_manager.get_flat_info(playlist_url, **opts)
 
-            if not info:
-                return
+        if not info:
+            return
 
-            entries = info.get('entries', [])
-            logger.info(f"Found {len(entries)} videos in playlist")
+        entries = info.get('entries', [])
+        logger.info(f"Found {len(entries)} videos in playlist")
 
-            # Add to download queue
-            for entry in entries:
-                try:
-                    await self.download_manager.add_download(
-                        url=entry['url'],
-                        output_path=params.get('output_path'),
-                        quality=params.get('quality'),
-                        priority=params.get('priority', 5)
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to add video to queue: {e}")
+        # Add to download queue in one batch
+        try:
+            await self.download_manager.add_downloads(
+                [url for url in map(_entry_url, entries) if url],
+                output_path=params.get('output_path'),
+                quality=params.get('quality'),
+                priority=params.get('priority', 5)
+            )
+        except Exception as e:
+            logger.error(f"Failed to add videos to queue: {e}")
 
     async def _check_channel_updates(self, params: Dict[str, Any]) -> None:
         """Check for channel updates and notify
@@ -267,26 +271,19 @@ class ScheduleManager(BaseService):
         if not channel_url:
             raise ValueError("channel_url parameter is required")
 
-        # Get latest video
-        opts = {
-            'extract_flat': True,
-            'quiet': True,
-            'playlistend': 1,  # Only get latest video
-        }
+        # Get latest video only
+        info = await self.download_manager.get_flat_info(channel_url, playlistend=1)
 
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(channel_url, download=False)
+        if info and info.get('entries'):
+            latest_video = info['entries'][0]
 
-            if info and info.get('entries'):
-                latest_video = info['entries'][0]
-
-                # Emit notification event
-                self.emit_event('new_video', {
-                    'channel': info.get('channel', 'Unknown'),
-                    'video_title': latest_video.get('title'),
-                    'video_url': latest_video.get('url'),
-                    'upload_date': latest_video.get('upload_date')
-                })
+            # Emit notification event
+            self.emit_event('new_video', {
+                'channel': info.get('channel', 'Unknown'),
+                'video_title': latest_video.get('title'),
+                'video_url': latest_video.get('url'),
+                'upload_date': latest_video.get('upload_date')
+            })
 
     async def remove_task(self, task_id: str) -> bool:
         """Remove a scheduled task